@@ -0,0 +1,47 @@
+import streamlit as st
+import pandas as pd
+
+PROBLEM_COLUMNS = ["problem_text", "answer", "explanation"]
+
+def normalize_answer(answer):
+    # Canonical form for comparing answers, so "12", "12.0" and " 12 " all match
+    if answer is None or pd.isna(answer):
+        return None
+    text = str(answer).strip()
+    try:
+        number = float(text)
+    except ValueError:
+        return text.casefold()
+    return str(int(number)) if number.is_integer() else repr(number)
+
+# Refresh the sheet hourly so teacher edits show up without a restart
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=4)
+def load_problems(url):
+    try:
+        # on_bad_lines='skip' ensures the app doesn't crash on bad rows
+        # pyarrow parses faster and stores the text columns compactly
+        df = pd.read_csv(
+            url,
+            engine="pyarrow",
+            dtype_backend="pyarrow",
+            usecols=PROBLEM_COLUMNS,
+            on_bad_lines='skip'
+        )
+        df["_answer_norm"] = df["answer"].map(normalize_answer)
+        # Similar-length problems are prefetched together in one request
+        df["_len_bucket"] = df["problem_text"].str.len().fillna(0) // 200
+        return df
+    except Exception as e:
+        st.error(f"Error loading Sheet: {e}")
+        return pd.DataFrame()
+
+# Flatten the sheet into plain lists once, so each rerun is just list indexing.
+# Keyed on the URL, so the DataFrame itself never has to be hashed.
+# cache_resource hands back the same object instead of unpickling a copy per
+# rerun, so callers must treat the lists as read-only.
+@st.cache_resource(ttl=3600, show_spinner=False, max_entries=4)
+def problems_as_cols(url):
+    df = load_problems(url)
+    if df.empty:
+        return {col: [] for col in PROBLEM_COLUMNS}
+    return {col: df[col].tolist() for col in df.columns}
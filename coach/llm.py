@@ -0,0 +1,151 @@
+import streamlit as st
+import google.generativeai as genai
+import json
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+
+TARGET_MODEL_NAME = "gemini-2.5-flash-lite"
+
+# Kept byte-identical across calls so Gemini can reuse the cached prompt prefix.
+# The requested hint level goes in the user message instead.
+SYSTEM_INSTRUCTION = """
+    You are a Socratic Math Coach for AMC 10.
+    GOAL: Help the student solve the problem WITHOUT giving the answer.
+    Each message asks for a hint at Level 1, 2 or 3.
+    INSTRUCTIONS:
+    - Level 1: Ask a clarifying question about a definition.
+    - Level 2: Suggest the first step.
+    - Level 3: Give a formula or strong clue.
+    - NEVER reveal the final answer key.
+    - Keep responses short.
+    """
+
+# Only this many recent messages are kept, both on screen and in the Gemini chat.
+# History resets every problem, so this is a safety net rather than a normal limit.
+MAX_CHAT_HISTORY = 40
+
+# genai.configure swaps the SDK's global client, and a model binds to it on its
+# first request, so call this right before sending anything. With max_entries=1
+# it is a no-op until some session uses a different key.
+@st.cache_resource(max_entries=1, ttl=3600)
+def _configure(api_key):
+    genai.configure(api_key=api_key)
+    return True
+
+# Streamlit reruns the whole script on every click, so build the model once
+# per key and reuse it. Bounded so rotated keys don't pile up in memory.
+@st.cache_resource(max_entries=2, ttl=3600)
+def get_model(api_key):
+    return genai.GenerativeModel(
+        model_name=TARGET_MODEL_NAME,
+        system_instruction=SYSTEM_INSTRUCTION
+    )
+
+# Hint requests run on a shared pool so a slow Gemini call never blocks the
+# script thread, and clicks that arrive meanwhile can be merged into one call.
+# Every session shares it, so it is sized for a whole class waiting on hints
+# and prefetches at once; the workers just wait on the network.
+@st.cache_resource
+def get_executor():
+    return ThreadPoolExecutor(max_workers=32)
+
+def _hint_prompt(problem_text, levels):
+    if len(levels) == 1:
+        return f"Problem: '{problem_text}'. I am stuck. Give me a Level {levels[0]} hint."
+    return (
+        f"Problem: '{problem_text}'. I am stuck. Give me Level {levels[0]}..{levels[-1]} hints in order. "
+        "Start each hint on its own line with 'Level N:'."
+    )
+
+def _split_hints(text, levels):
+    if len(levels) == 1:
+        return [text]
+    parts = re.split(r"^[ \t*#]*Level\s+\d+\**\s*:\**\s*", text, flags=re.MULTILINE)
+    parts = [part.strip() for part in parts if part.strip()]
+    # If the reply doesn't follow the format, show it as a single hint
+    return parts if len(parts) == len(levels) else [text]
+
+def _send_hints(chat, problem_text, levels, chunks):
+    try:
+        chat.history = chat.history[-MAX_CHAT_HISTORY:]
+        # Stream so the UI can show text as it arrives; `chunks` is read by the script thread
+        response = chat.send_message(_hint_prompt(problem_text, levels), stream=True)
+        for chunk in response:
+            chunks.append(chunk.text)
+        return _split_hints("".join(chunks), levels)
+    except Exception as e:
+        return [f"Error contacting Gemini ({TARGET_MODEL_NAME}): {e}"]
+
+def _chat_is_broken(chat):
+    # The SDK raises on reading history after a blocked or failed streamed reply
+    try:
+        chat.history
+    except Exception:
+        return True
+    return False
+
+def _to_gemini_history(chat_history):
+    return [
+        {"role": "user" if msg["role"] == "user" else "model", "parts": [msg["content"]]}
+        for msg in chat_history
+    ]
+
+def get_gemini_hint(api_key, problem_text, levels, chunks):
+    # Starts one request for all `levels`; text streams into `chunks`, the Future holds the hints
+    if not api_key:
+        future = Future()
+        future.set_result(["⚠️ Please enter an API Key in the sidebar."])
+        return future
+    _configure(api_key)
+
+    # Keep one ChatSession per problem so the SDK tracks history itself.
+    # A blocked or failed stream leaves that chat unusable, so rebuild it
+    # from the messages the student saw.
+    chat = st.session_state.get("gemini_chat")
+    if chat is None or _chat_is_broken(chat):
+        chat = get_model(api_key).start_chat(history=_to_gemini_history(st.session_state.chat_history))
+        st.session_state.gemini_chat = chat
+
+    return get_executor().submit(_send_hints, chat, problem_text, levels, chunks)
+
+def _send_first_hints(model, problem_texts):
+    numbered = "\n".join(f"{i}) {text}" for i, text in enumerate(problem_texts, 1))
+    try:
+        # JSON keeps numbered steps inside a hint from being read as the next problem
+        response = model.generate_content(
+            "For each problem below, give a Level 1 hint. Reply with a JSON array of "
+            f"exactly {len(problem_texts)} strings, one hint per problem, in order.\n" + numbered,
+            generation_config={"response_mime_type": "application/json"},
+        )
+        hints = json.loads(response.text)
+    except Exception:
+        # Prefetching is best effort; Get Hint will just ask again
+        return {}
+    # Drop the whole batch unless every problem got its own hint
+    if (
+        not isinstance(hints, list)
+        or len(hints) != len(problem_texts)
+        or not all(isinstance(hint, str) and hint.strip() for hint in hints)
+    ):
+        return {}
+    return {text: hint.strip() for text, hint in zip(problem_texts, hints)}
+
+def prefetch_first_hints(api_key, problem_texts):
+    # Starts one request for the Level 1 hints of upcoming problems not already requested
+    requested = {text for batch in st.session_state.prefetch for text in batch["problem_texts"]}
+    problem_texts = [text for text in problem_texts if text not in requested]
+    if not api_key or not problem_texts:
+        return
+    _configure(api_key)
+    future = get_executor().submit(_send_first_hints, get_model(api_key), problem_texts)
+    # Only the last few batches can still be relevant
+    st.session_state.prefetch = st.session_state.prefetch[-2:] + [
+        {"problem_texts": problem_texts, "future": future}
+    ]
+
+def start_chat_with_hint(api_key, problem_text, hint):
+    # Starts a chat whose history already holds a prefetched Level 1 hint
+    return get_model(api_key).start_chat(history=[
+        {"role": "user", "parts": [_hint_prompt(problem_text, [1])]},
+        {"role": "model", "parts": [hint]},
+    ])
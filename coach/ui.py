@@ -0,0 +1,219 @@
+import streamlit as st
+import time
+
+from coach.data import normalize_answer, problems_as_cols
+from coach.llm import (
+    MAX_CHAT_HISTORY, get_gemini_hint, prefetch_first_hints, start_chat_with_hint
+)
+
+# How many upcoming problems to fetch Level 1 hints for in one request
+PREFETCH_COUNT = 3
+
+DEFAULT_SHEET = "https://docs.google.com/spreadsheets/d/e/2PACX-1vQMfKhGbygEfKIRB45IZrR-sObCD1YHtvxtbyNFTShTgp60E-VednIdO9g7Anx_D1v406Dd9TK2S5lq/pub?gid=0&single=true&output=csv"
+
+def _stream_chunks(future, chunks):
+    # Replays from the start, so a rerun mid-stream loses nothing
+    shown = 0
+    while True:
+        done = future.done()
+        while shown < len(chunks):
+            yield chunks[shown]
+            shown += 1
+        if done:
+            return
+        time.sleep(0.05)
+
+def _prefetch_batch(problems, index):
+    # The problem after `index`, plus later ones in the same length bucket
+    num_problems = len(problems["problem_text"])
+    first = (index + 1) % num_problems
+    batch = [first]
+    for step in range(2, num_problems):
+        if len(batch) == PREFETCH_COUNT:
+            break
+        candidate = (index + step) % num_problems
+        if problems["_len_bucket"][candidate] == problems["_len_bucket"][first]:
+            batch.append(candidate)
+    return [problems["problem_text"][i] for i in batch]
+
+def _draw_message(msg):
+    icon = "🧑‍🎓" if msg["role"] == "user" else "🤖"
+    with st.chat_message(msg["role"], avatar=icon):
+        st.write(msg["content"])
+
+def _add_hint(hint):
+    # Appends a hint to the chat history and draws it below the earlier messages
+    new_messages = [{"role": "user", "content": "I'm stuck."}, {"role": "assistant", "content": hint}]
+    for msg in new_messages:
+        _draw_message(msg)
+    # Sliding window so long sessions don't grow without bound
+    st.session_state.chat_history = (st.session_state.chat_history + new_messages)[-MAX_CHAT_HISTORY:]
+
+def _take_prefetched_hint(problem_text):
+    # Only a finished batch helps; while it is running a normal streamed hint is faster
+    for batch in st.session_state.prefetch:
+        if problem_text in batch["problem_texts"] and batch["future"].done():
+            hints = batch["future"].result()
+            if problem_text in hints:
+                return hints.pop(problem_text)
+    return None
+
+def pump_hints(api_key, problem_text):
+    # Sends any queued levels, streams each reply, then moves it into the chat history
+    while True:
+        if (
+            st.session_state.inflight is None
+            and st.session_state.pending_levels[:1] == [1]
+            and st.session_state.gemini_chat is None
+        ):
+            # Use the Level 1 hint prefetched after an earlier correct answer
+            hint = _take_prefetched_hint(problem_text)
+            if hint is not None:
+                st.session_state.gemini_chat = start_chat_with_hint(api_key, problem_text, hint)
+                _add_hint(hint)
+                st.session_state.pending_levels = st.session_state.pending_levels[1:]
+
+        if st.session_state.inflight is None and st.session_state.pending_levels:
+            st.session_state.inflight_chunks = []
+            st.session_state.inflight = get_gemini_hint(
+                api_key, problem_text, st.session_state.pending_levels, st.session_state.inflight_chunks
+            )
+            st.session_state.pending_levels = []
+
+        inflight = st.session_state.inflight
+        if inflight is None:
+            return
+
+        # A click during the stream reruns the script; the request keeps going
+        # in the background and its level is queued for the next request.
+        if not inflight.done():
+            placeholder = st.empty()
+            with placeholder.container():
+                with st.chat_message("assistant", avatar="🤖"):
+                    st.write_stream(_stream_chunks(inflight, st.session_state.inflight_chunks))
+            # Replaced by the finished hint(s) drawn by _add_hint below
+            placeholder.empty()
+
+        for hint in inflight.result():
+            _add_hint(hint)
+        st.session_state.inflight = None
+
+# Runs as a fragment so hint clicks only redraw the chat, not the whole page
+@st.fragment
+def chat_panel(api_key, current_problem):
+    for msg in st.session_state.chat_history:
+        _draw_message(msg)
+    # New hints are drawn here as they finish, so no rerun is needed to show them
+    hint_stream = st.container()
+
+    if st.button("💡 Get Hint"):
+        if st.session_state.hint_level < 3:
+            st.session_state.hint_level += 1
+            st.session_state.pending_levels.append(st.session_state.hint_level)
+        else:
+            st.warning("No more hints available!")
+
+    with hint_stream:
+        pump_hints(api_key, current_problem['problem_text'])
+
+def main():
+    # 1. Page Config
+    st.set_page_config(page_title="Gemini Math Coach", page_icon="♾️")
+
+    # --- SIDEBAR & SETUP ---
+    with st.sidebar:
+        st.header("Teacher Settings")
+        
+        # Secure API Key Handling
+        if "GEMINI_API_KEY" in st.secrets:
+            api_key = st.secrets["GEMINI_API_KEY"]
+        else:
+            api_key = st.text_input("Gemini API Key", type="password")
+
+        # Problem Sheet URL
+        sheet_url = st.text_input("Problem Bank (CSV URL)", value=DEFAULT_SHEET)
+        
+        # Reset Button
+        if st.button("Reset Session"):
+            st.session_state.hint_level = 0
+            st.session_state.chat_history = []
+            st.session_state.gemini_chat = None
+            st.session_state.pending_levels = []
+            st.session_state.inflight = None
+            st.session_state.solved = False
+            st.rerun()
+
+    # --- MAIN APP LOGIC ---
+
+    # 2. Load Data
+    problems = problems_as_cols(sheet_url)
+    num_problems = len(problems["problem_text"])
+
+    # 3. Initialize Session State
+    if "current_problem_index" not in st.session_state:
+        st.session_state.current_problem_index = 0
+    if "hint_level" not in st.session_state:
+        st.session_state.hint_level = 0
+    if "chat_history" not in st.session_state:
+        st.session_state.chat_history = []
+    if "pending_levels" not in st.session_state:
+        st.session_state.pending_levels = []
+    if "inflight" not in st.session_state:
+        st.session_state.inflight = None
+    if "gemini_chat" not in st.session_state:
+        st.session_state.gemini_chat = None
+    if "prefetch" not in st.session_state:
+        st.session_state.prefetch = []
+    if "solved" not in st.session_state:
+        st.session_state.solved = False
+
+    # 4. Select Problem (with safety check)
+    if num_problems == 0:
+        st.warning("No problems found. Check your Google Sheet link.")
+        st.stop()
+    elif st.session_state.current_problem_index >= num_problems:
+        st.session_state.current_problem_index = 0
+
+    current_problem = {col: values[st.session_state.current_problem_index] for col, values in problems.items()}
+
+    # 5. User Interface
+    st.title("Gemini Math Coach 🇬")
+    st.progress((st.session_state.current_problem_index + 1) / num_problems)
+
+    st.markdown(f"### Problem #{st.session_state.current_problem_index + 1}")
+    st.info(current_problem['problem_text'])
+
+    # Chat Display
+    # Filled in last so a streaming hint doesn't hold up the answer form below
+    chat_area = st.container()
+
+    # A form only reruns the script on submit, not on every edit of the answer box
+    with st.form("answer_form"):
+        user_ans = st.text_input("Your Answer:", placeholder="e.g. 12")
+        submitted = st.form_submit_button("Submit Answer")
+    if submitted:
+        # Compare canonical forms to avoid number format mismatches
+        if normalize_answer(user_ans) == current_problem['_answer_norm']:
+            st.session_state.solved = True
+            st.balloons()
+            # Students usually ask for a hint right away, so start it now
+            prefetch_first_hints(api_key, _prefetch_batch(problems, st.session_state.current_problem_index))
+        else:
+            st.error("❌ Try again.")
+
+    # Kept in session state so "Next Problem" still shows after the submit rerun
+    if st.session_state.solved:
+        st.success("✅ Correct!")
+        st.markdown(f"**Explanation:** {current_problem['explanation']}")
+        if st.button("Next Problem ➡️"):
+            st.session_state.current_problem_index += 1
+            st.session_state.hint_level = 0
+            st.session_state.chat_history = []
+            st.session_state.gemini_chat = None
+            st.session_state.pending_levels = []
+            st.session_state.inflight = None
+            st.session_state.solved = False
+            st.rerun()
+
+    with chat_area:
+        chat_panel(api_key, current_problem)